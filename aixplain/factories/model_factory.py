@@ -23,16 +23,22 @@ Description:
 from typing import Dict, List, Optional, Text, Tuple, Union
 import json
 import logging
+import requests
 from aixplain.modules.model import Model
 from aixplain.modules.model.llm_model import LLM
 from aixplain.enums import Function, Language, OwnershipType, Supplier, SortBy, SortOrder
 from aixplain.utils import config
-from aixplain.utils.file_utils import _request_with_retry
+from aixplain.utils.file_utils import _build_session, _request_with_retry
 from urllib.parse import urljoin
 from warnings import warn
 from aixplain.enums.function import FunctionInputOutput
 from datetime import datetime
 
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
 
 class ModelFactory:
     """A static class for creating and exploring Model Objects.
@@ -43,20 +49,59 @@ class ModelFactory:
 
     aixplain_key = config.AIXPLAIN_API_KEY
     backend_url = config.BACKEND_URL
+    # backend url and the models url resolved from it
+    _models_url_cache = (None, None)
+    _session = None
+
+    @classmethod
+    def _get_models_url(cls) -> Text:
+        """Returns the base URL of the model endpoints, resolving it again only when backend_url changes
+
+        Returns:
+            Text: models URL, ending with a slash
+        """
+        backend_url, models_url = cls._models_url_cache
+        if backend_url != cls.backend_url:
+            models_url = urljoin(cls.backend_url, "sdk/models/")
+            cls._models_url_cache = (cls.backend_url, models_url)
+        return models_url
 
     @classmethod
-    def _create_model_from_response(cls, response: Dict) -> Model:
+    def _get_session(cls) -> requests.Session:
+        """Returns the session shared by all backend calls of the factory, creating it on first use
+
+        Reusing one session keeps the connections to the backend alive between calls
+        instead of paying the TCP and TLS handshakes on every request.
+
+        Returns:
+            requests.Session: shared session
+        """
+        if cls._session is None:
+            cls._session = _build_session(pool_connections=16, pool_maxsize=32)
+        return cls._session
+
+    @classmethod
+    def _build_headers(cls) -> Dict:
+        """Builds the headers to query the model endpoints, authenticating with the aiXplain key when set
+
+        Returns:
+            Dict: request headers
+        """
+        if cls.aixplain_key != "":
+            return {"x-aixplain-key": f"{cls.aixplain_key}", "Content-Type": "application/json"}
+        return {"Authorization": f"Token {config.TEAM_API_KEY}", "Content-Type": "application/json"}
+
+    @classmethod
+    def _create_model_from_response(cls, response: Dict, api_key: Text) -> Model:
         """Converts response Json to 'Model' object
 
         Args:
             response (Dict): Json from API
+            api_key (Text): API key of the model
 
         Returns:
             Model: Coverted 'Model' object
         """
-        if "api_key" not in response:
-            response["api_key"] = config.TEAM_API_KEY
-
         parameters = {}
         if "params" in response:
             for param in response["params"]:
@@ -82,7 +127,7 @@ class ModelFactory:
             response["name"],
             description=response.get("description", ""),
             supplier=response["supplier"],
-            api_key=response["api_key"],
+            api_key=api_key,
             cost=response["pricing"],
             function=function,
             created_at=created_at,
@@ -106,13 +151,10 @@ class ModelFactory:
         """
         resp = None
         try:
-            url = urljoin(cls.backend_url, f"sdk/models/{model_id}")
-            if cls.aixplain_key != "":
-                headers = {"x-aixplain-key": f"{cls.aixplain_key}", "Content-Type": "application/json"}
-            else:
-                headers = {"Authorization": f"Token {config.TEAM_API_KEY}", "Content-Type": "application/json"}
+            url = cls._get_models_url() + model_id
+            headers = cls._build_headers()
             logging.info(f"Start service for GET Model  - {url} - {headers}")
-            r = _request_with_retry("get", url, headers=headers)
+            r = _request_with_retry("get", url, headers=headers, session=cls._get_session())
             resp = r.json()
 
         except Exception:
@@ -125,10 +167,9 @@ class ModelFactory:
             logging.error(message)
             raise Exception(f"{message}")
         if 200 <= r.status_code < 300:
-            resp["api_key"] = config.TEAM_API_KEY
-            if api_key is not None:
-                resp["api_key"] = api_key
-            model = cls._create_model_from_response(resp)
+            if api_key is None:
+                api_key = config.TEAM_API_KEY
+            model = cls._create_model_from_response(resp, api_key)
             logging.info(f"Model Creation: Model {model_id} instantiated.")
             return model
         else:
@@ -161,7 +202,7 @@ class ModelFactory:
         sort_order: SortOrder = SortOrder.ASCENDING,
     ) -> List[Model]:
         try:
-            url = urljoin(cls.backend_url, "sdk/models/paginate")
+            url = cls._get_models_url() + "paginate"
             filter_params = {"q": query, "pageNumber": page_number, "pageSize": page_size}
             if is_finetunable is not None:
                 filter_params["isFineTunable"] = is_finetunable
@@ -196,14 +237,12 @@ class ModelFactory:
                 filter_params["sort"] = [{"dir": sort_order.value, "field": sort_by.value}]
             if len(lang_filter_params) != 0:
                 filter_params["ioFilter"] = lang_filter_params
-            if cls.aixplain_key != "":
-                headers = {"x-aixplain-key": f"{cls.aixplain_key}", "Content-Type": "application/json"}
-            else:
-                headers = {"Authorization": f"Token {config.TEAM_API_KEY}", "Content-Type": "application/json"}
+            headers = cls._build_headers()
 
             logging.info(f"Start service for POST Models Paginate - {url} - {headers} - {json.dumps(filter_params)}")
-            r = _request_with_retry("post", url, headers=headers, json=filter_params)
-            resp = r.json()
+            r = _request_with_retry("post", url, headers=headers, session=cls._get_session(), json=filter_params)
+            # pages can hold hundreds of models, so prefer the faster decoder when available
+            resp = orjson.loads(r.content) if orjson is not None else r.json()
 
         except Exception as e:
             error_message = f"Listing Models: Error in getting Models on Page {page_number}: {e}"
@@ -212,7 +251,8 @@ class ModelFactory:
         if 200 <= r.status_code < 300:
             logging.info(f"Listing Models: Status of getting Models on Page {page_number}: {r.status_code}")
             all_models = resp["items"]
-            model_list = [cls._create_model_from_response(model_info_json) for model_info_json in all_models]
+            api_key = config.TEAM_API_KEY
+            model_list = [cls._create_model_from_response(model_info_json, api_key) for model_info_json in all_models]
             return model_list, resp["total"]
         else:
             error_message = f"Listing Models Error: Failed to retrieve models. Status Code: {r.status_code}. Error: {resp}"
@@ -286,7 +326,7 @@ class ModelFactory:
             headers = {"x-api-key": f"{api_key}", "Content-Type": "application/json"}
         else:
             headers = {"x-api-key": f"{config.TEAM_API_KEY}", "Content-Type": "application/json"}
-        response = _request_with_retry("get", machines_url, headers=headers)
+        response = _request_with_retry("get", machines_url, headers=headers, session=cls._get_session())
         response_dicts = json.loads(response.text)
         for dictionary in response_dicts:
             del dictionary["id"]
@@ -307,7 +347,7 @@ class ModelFactory:
             headers = {"Authorization": f"Token {api_key}", "Content-Type": "application/json"}
         else:
             headers = {"Authorization": f"Token {config.TEAM_API_KEY}", "Content-Type": "application/json"}
-        response = _request_with_retry("get", gpu_url, headers=headers)
+        response = _request_with_retry("get", gpu_url, headers=headers, session=cls._get_session())
         response_list = json.loads(response.text)
         return response_list
 
@@ -330,7 +370,7 @@ class ModelFactory:
             headers = {"x-api-key": f"{api_key}", "Content-Type": "application/json"}
         else:
             headers = {"x-api-key": f"{config.TEAM_API_KEY}", "Content-Type": "application/json"}
-        response = _request_with_retry("get", functions_url, headers=headers)
+        response = _request_with_retry("get", functions_url, headers=headers, session=cls._get_session())
         response_dict = json.loads(response.text)
         if verbose:
             return response_dict
@@ -404,7 +444,7 @@ class ModelFactory:
             "onboardingParams": {},
         }
         logging.debug(f"Body: {str(payload)}")
-        response = _request_with_retry("post", create_url, headers=headers, json=payload)
+        response = _request_with_retry("post", create_url, headers=headers, session=cls._get_session(), json=payload)
 
         assert response.status_code == 201
 
@@ -427,7 +467,7 @@ class ModelFactory:
             headers = {"Authorization": f"Token {api_key}", "Content-Type": "application/json"}
         else:
             headers = {"Authorization": f"Token {config.TEAM_API_KEY}", "Content-Type": "application/json"}
-        response = _request_with_retry("post", login_url, headers=headers)
+        response = _request_with_retry("post", login_url, headers=headers, session=cls._get_session())
         response_dict = json.loads(response.text)
         return response_dict
 
@@ -459,7 +499,7 @@ class ModelFactory:
             headers = {"x-api-key": f"{config.TEAM_API_KEY}", "Content-Type": "application/json"}
         payload = {"image": image_tag, "sha": image_hash, "hostMachine": host_machine}
         logging.debug(f"Body: {str(payload)}")
-        response = _request_with_retry("post", onboard_url, headers=headers, json=payload)
+        response = _request_with_retry("post", onboard_url, headers=headers, session=cls._get_session(), json=payload)
         if response.status_code == 201:
             message = "Your onboarding request has been submitted to an aiXplain specialist for finalization. We will notify you when the process is completed."
             logging.info(message)
@@ -509,7 +549,7 @@ class ModelFactory:
                 "revision": revision,
             },
         }
-        response = _request_with_retry("post", deploy_url, headers=headers, json=body)
+        response = _request_with_retry("post", deploy_url, headers=headers, session=cls._get_session(), json=body)
         logging.debug(response.text)
         response_dicts = json.loads(response.text)
         return response_dicts
@@ -529,7 +569,7 @@ class ModelFactory:
             headers = {"Authorization": f"Token {api_key}", "Content-Type": "application/json"}
         else:
             headers = {"Authorization": f"Token {config.TEAM_API_KEY}", "Content-Type": "application/json"}
-        response = _request_with_retry("get", status_url, headers=headers)
+        response = _request_with_retry("get", status_url, headers=headers, session=cls._get_session())
         logging.debug(response.text)
         response_dicts = json.loads(response.text)
         ret_dict = {
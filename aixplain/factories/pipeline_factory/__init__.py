@@ -23,6 +23,8 @@ Description:
 import json
 import os
 import logging
+import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Text, Union
 from aixplain.factories.pipeline_factory.utils import build_from_response
 from aixplain.enums.data_type import DataType
@@ -31,7 +33,7 @@ from aixplain.enums.supplier import Supplier
 from aixplain.modules.model import Model
 from aixplain.modules.pipeline import Pipeline
 from aixplain.utils import config
-from aixplain.utils.file_utils import _request_with_retry
+from aixplain.utils.file_utils import _build_session, _request_with_retry
 from urllib.parse import urljoin
 from warnings import warn
 
@@ -45,6 +47,22 @@ class PipelineFactory:
 
     aixplain_key = config.AIXPLAIN_API_KEY
     backend_url = config.BACKEND_URL
+    # maximum number of pages fetched concurrently by get_first_k_assets
+    _max_page_workers = 8
+    _session = None
+
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """Returns the session shared by the page fetches of the factory, creating it on first use
+
+        The connection pool is sized to the page workers so that concurrent fetches reuse connections.
+
+        Returns:
+            requests.Session: shared session
+        """
+        if cls._session is None:
+            cls._session = _build_session(pool_maxsize=cls._max_page_workers)
+        return cls._session
 
     @classmethod
     def get(cls, pipeline_id: Text, api_key: Optional[Text] = None) -> Pipeline:
@@ -135,7 +153,7 @@ class PipelineFactory:
                     "Authorization": f"Token {config.TEAM_API_KEY}",
                     "Content-Type": "application/json",
                 }
-            r = _request_with_retry("get", url, headers=headers)
+            r = _request_with_retry("get", url, headers=headers, session=cls._get_session())
             resp = r.json()
             logging.info(f"Listing Pipelines: Status of getting Pipelines on Page {page_number}: {resp}")
             all_pipelines = resp["items"]
@@ -156,10 +174,12 @@ class PipelineFactory:
             List[Pipeline]: List of pipelines based on given filters
         """
         try:
-            pipeline_list = []
             assert k > 0
-            for page_number in range(k // 10 + 1):
-                pipeline_list += cls.get_assets_from_page(page_number)
+            # pages are independent, so fetch them concurrently
+            page_numbers = range(k // 10 + 1)
+            with ThreadPoolExecutor(max_workers=min(cls._max_page_workers, len(page_numbers))) as executor:
+                pages = list(executor.map(cls.get_assets_from_page, page_numbers))
+            pipeline_list = [pipeline for page in pages for pipeline in page]
             return pipeline_list
         except Exception as e:
             error_message = f"Listing Pipelines: Error in getting {k} Pipelines: {e}"
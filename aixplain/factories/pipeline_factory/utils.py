@@ -115,4 +115,6 @@ def build_from_response(response: Dict, load_architecture: bool = False) -> Pipe
             logging.warning("Error loading pipeline architecture:, error: %s", e)
             pipeline.nodes = []
             pipeline.links = []
+            pipeline._from_nodes = set()
+            pipeline._to_nodes = set()
     return pipeline
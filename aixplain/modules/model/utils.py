@@ -5,6 +5,18 @@ import logging
 from aixplain.utils.file_utils import _request_with_retry
 from typing import Dict, Text, Union, Optional
 
+# error message prefixes of failed run requests, the response details are appended to them
+_ERROR_MESSAGES_BY_STATUS = {
+    401: "Unauthorized API key: Please verify the spelling of the API key and its current validity. Details: ",
+}
+# 46x, 47x, 48x and 49x responses share one prefix per range, indexed by status_code // 10
+_ERROR_MESSAGES_BY_STATUS_RANGE = {
+    46: "Subscription-related error: Please ensure that your subscription is active and has not expired. Details: ",
+    47: "Billing-related error: Please ensure you have enough credits to run this model. Details: ",
+    48: "Supplier-related error: Please ensure that the selected supplier provides the model you are trying to access. Details: ",
+    49: "",
+}
+
 
 def build_payload(data: Union[Text, Dict], parameters: Optional[Dict] = None):
     from aixplain.factories import FileFactory
@@ -61,16 +73,11 @@ def call_run_endpoint(url: Text, api_key: Text, payload: Dict) -> Dict:
             response = resp
     else:
         resp = resp["error"] if isinstance(resp, dict) and "error" in resp else resp
-        if r.status_code == 401:
-            error = f"Unauthorized API key: Please verify the spelling of the API key and its current validity. Details: {resp}"
-        elif 460 <= r.status_code < 470:
-            error = f"Subscription-related error: Please ensure that your subscription is active and has not expired. Details: {resp}"
-        elif 470 <= r.status_code < 480:
-            error = f"Billing-related error: Please ensure you have enough credits to run this model. Details: {resp}"
-        elif 480 <= r.status_code < 490:
-            error = f"Supplier-related error: Please ensure that the selected supplier provides the model you are trying to access. Details: {resp}"
-        elif 490 <= r.status_code < 500:
-            error = f"{resp}"
+        prefix = _ERROR_MESSAGES_BY_STATUS.get(r.status_code)
+        if prefix is None and 460 <= r.status_code < 500:
+            prefix = _ERROR_MESSAGES_BY_STATUS_RANGE[r.status_code // 10]
+        if prefix is not None:
+            error = f"{prefix}{resp}"
         else:
             status_code = str(r.status_code)
             error = f"Status {status_code} - Unspecified error: {resp}"
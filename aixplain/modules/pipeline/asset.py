@@ -436,9 +436,6 @@ class Pipeline(Asset):
         try:
             pipeline = self.to_dict()
 
-            for i, node in enumerate(pipeline["nodes"]):
-                if "functionType" in node:
-                    pipeline["nodes"][i]["functionType"] = pipeline["nodes"][i]["functionType"].lower()
             # prepare payload
             status = "draft"
             if save_as_asset is True:
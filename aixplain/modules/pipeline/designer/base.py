@@ -1,4 +1,5 @@
 from typing import (
+    Dict,
     List,
     Union,
     TYPE_CHECKING,
@@ -19,8 +20,13 @@ if TYPE_CHECKING:
 TI = TypeVar("TI", bound="Inputs")
 TO = TypeVar("TO", bound="Outputs")
 
+# node classes registered by their node type, see Node.__init_subclass__
+_NODE_CLASSES: Dict[NodeType, Type["Node"]] = {}
+
 
 class Serializable:
+    __slots__ = ()
+
     def serialize(self) -> dict:
         raise NotImplementedError()
 
@@ -224,6 +230,8 @@ class Link(Serializable):
 
         self.pipeline = pipeline
         self.pipeline.links.append(self)
+        self.pipeline._from_nodes.add(self.from_node)
+        self.pipeline._to_nodes.add(self.to_node)
         return self
 
     def serialize(self) -> dict:
@@ -348,6 +356,18 @@ class Node(Generic[TI, TO], Serializable):
     outputs_class: Optional[Type[TO]] = Outputs
     pipeline: Optional["DesignerPipeline"] = None
 
+    def __init_subclass__(cls, node_type: Optional[NodeType] = None, **kwargs):
+        """
+        Set the node type of the subclass and register it so that the node
+        class can be looked up by its type, e.g. when loading a pipeline.
+
+        :param node_type: the node type of the subclass
+        """
+        super().__init_subclass__(**kwargs)
+        if node_type is not None:
+            cls.type = node_type
+            _NODE_CLASSES[node_type] = cls
+
     def __init__(
         self,
         pipeline: "DesignerPipeline" = None,
@@ -28,7 +28,7 @@ if TYPE_CHECKING:
     from .pipeline import DesignerPipeline
 
 
-class AssetNode(Node[TI, TO], LinkableMixin, OutputableMixin):
+class AssetNode(Node[TI, TO], LinkableMixin, OutputableMixin, node_type=NodeType.ASSET):
     """
     Asset node class, this node will be used to fetch the asset from the
     aixplain platform and use it in the pipeline.
@@ -47,8 +47,6 @@ class AssetNode(Node[TI, TO], LinkableMixin, OutputableMixin):
     assetType: AssetType = AssetType.MODEL
     functionType: FunctionType = FunctionType.AI
 
-    type: NodeType = NodeType.ASSET
-
     def __init__(
         self,
         asset_id: Union[Model, str] = None,
@@ -123,7 +121,7 @@ class AssetNode(Node[TI, TO], LinkableMixin, OutputableMixin):
         obj["supplier"] = self.supplier
         obj["version"] = self.version
         obj["assetType"] = self.assetType
-        obj["functionType"] = self.functionType
+        obj["functionType"] = self.functionType.lower()
         obj["type"] = self.type
         return obj
 
@@ -152,7 +150,7 @@ class InputOutputs(Outputs):
         self.input = self.create_param("input")
 
 
-class Input(Node[InputInputs, InputOutputs], LinkableMixin, RoutableMixin):
+class Input(Node[InputInputs, InputOutputs], LinkableMixin, RoutableMixin, node_type=NodeType.INPUT):
     """
     Input node class, this node will be used to input the data to the
     pipeline.
@@ -165,7 +163,6 @@ class Input(Node[InputInputs, InputOutputs], LinkableMixin, RoutableMixin):
 
     data_types: Optional[List[DataType]] = None
     data: Optional[str] = None
-    type: NodeType = NodeType.INPUT
     inputs_class: Type[TI] = InputInputs
     outputs_class: Type[TO] = InputOutputs
 
@@ -204,7 +201,7 @@ class OutputOutputs(Outputs):
     pass
 
 
-class Output(Node[OutputInputs, OutputOutputs]):
+class Output(Node[OutputInputs, OutputOutputs], node_type=NodeType.OUTPUT):
     """
     Output node class, this node will be used to output the result of the
     pipeline.
@@ -213,7 +210,6 @@ class Output(Node[OutputInputs, OutputOutputs]):
     """
 
     data_types: Optional[List[DataType]] = None
-    type: NodeType = NodeType.OUTPUT
     inputs_class: Type[TI] = OutputInputs
     outputs_class: Type[TO] = OutputOutputs
 
@@ -227,7 +223,7 @@ class Output(Node[OutputInputs, OutputOutputs]):
         return obj
 
 
-class Script(Node[TI, TO], LinkableMixin, OutputableMixin):
+class Script(Node[TI, TO], LinkableMixin, OutputableMixin, node_type=NodeType.SCRIPT):
     """
     Script node class, this node will be used to run a script on the input
     data.
@@ -238,7 +234,6 @@ class Script(Node[TI, TO], LinkableMixin, OutputableMixin):
 
     fileId: Optional[str] = None
     script_path: Optional[str] = None
-    type: NodeType = NodeType.SCRIPT
 
     def __init__(
         self,
@@ -273,6 +268,8 @@ class Route(Serializable):
     nodes based on the input data type.
     """
 
+    __slots__ = ("value", "path", "operation", "type")
+
     value: DataType
     path: List[Union[Node, int]]
     operation: Operation
@@ -323,14 +320,13 @@ class RouterOutputs(Outputs):
         self.input = self.create_param("input")
 
 
-class Router(Node[RouterInputs, RouterOutputs], LinkableMixin):
+class Router(Node[RouterInputs, RouterOutputs], LinkableMixin, node_type=NodeType.ROUTER):
     """
     Router node class, this node will be used to route the input data to
     different nodes based on the input data type.
     """
 
     routes: List[Route]
-    type: NodeType = NodeType.ROUTER
     inputs_class: Type[TI] = RouterInputs
     outputs_class: Type[TO] = RouterOutputs
 
@@ -362,14 +358,13 @@ class DecisionOutputs(Outputs):
         self.input = self.create_param("input")
 
 
-class Decision(Node[DecisionInputs, DecisionOutputs], LinkableMixin):
+class Decision(Node[DecisionInputs, DecisionOutputs], LinkableMixin, node_type=NodeType.DECISION):
     """
     Decision node class, this node will be used to make decisions based on
     the input data.
     """
 
     routes: List[Route]
-    type: NodeType = NodeType.DECISION
     inputs_class: Type[TI] = DecisionInputs
     outputs_class: Type[TO] = DecisionOutputs
 
@@ -1,4 +1,4 @@
-from typing import List, Type, Tuple, TypeVar
+from typing import Any, List, Optional, Set, Type, Tuple, TypeVar
 
 from aixplain.enums import DataType
 
@@ -25,11 +25,18 @@ T = TypeVar("T", bound="AssetNode")
 class DesignerPipeline(Serializable):
     nodes: List[Node] = None
     links: List[Link] = None
-    instance: any = None
+    instance: Optional[Any] = None
+
+    # nodes having outgoing and incoming links, kept up to date as links are
+    # attached so that validation does not need to scan the links
+    _from_nodes: Set[Node] = None
+    _to_nodes: Set[Node] = None
 
     def __init__(self):
         self.nodes = []
         self.links = []
+        self._from_nodes = set()
+        self._to_nodes = set()
 
     def add_node(self, node: Node):
         """
@@ -82,29 +89,31 @@ class DesignerPipeline(Serializable):
 
         :raises ValueError: if the pipeline is not valid
         """
-        link_from_map = {link.from_node.number: link for link in self.links}
-        link_to_map = {link.to_node.number: link for link in self.links}
+        from_nodes = self._from_nodes
+        to_nodes = self._to_nodes
+        input_type = NodeType.INPUT
+        output_type = NodeType.OUTPUT
         contains_input = False
         contains_output = False
         contains_asset = False
         for node in self.nodes:
             # validate every input node is linked out
-            if node.type == NodeType.INPUT:
+            if node.type == input_type:
                 contains_input = True
-                if node.number not in link_from_map:
+                if node not in from_nodes:
                     raise ValueError(f"Input node {node.label} not linked out")
             # validate every output node is linked in
-            elif node.type == NodeType.OUTPUT:
+            elif node.type == output_type:
                 contains_output = True
-                if node.number not in link_to_map:
+                if node not in to_nodes:
                     raise ValueError(f"Output node {node.label} not linked in")
             # validate rest of the nodes are linked in and out
             else:
                 if isinstance(node, OutputableMixin):
                     contains_asset = True
-                if node.number not in link_from_map:
+                if node not in from_nodes:
                     raise ValueError(f"Node {node.label} not linked in")
-                if node.number not in link_to_map:
+                if node not in to_nodes:
                     raise ValueError(f"Node {node.label} not linked out")
 
         if not contains_input or not contains_output or not contains_asset:
@@ -296,14 +305,17 @@ class DesignerPipeline(Serializable):
         :param kwargs: keyword arguments
         :return: the node
         """
+        route_type = RouteType.CHECK_TYPE
+        operation = Operation.EQUAL
+        route_class = Route
         kwargs["routes"] = [
-            Route(
-                value=route[0],
-                path=[route[1]],
-                type=RouteType.CHECK_TYPE,
-                operation=Operation.EQUAL,
+            route_class(
+                value=value,
+                path=[node],
+                type=route_type,
+                operation=operation,
             )
-            for route in routes
+            for value, node in routes
         ]
         return Router(*args, pipeline=self, **kwargs)
 
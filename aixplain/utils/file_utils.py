@@ -52,20 +52,39 @@ def save_file(download_url: Text, download_file_path: Optional[Any] = None) -> A
     return download_file_path
 
 
-def _request_with_retry(method: Text, url: Text, **params) -> requests.Response:
+def _build_session(pool_connections: int = 10, pool_maxsize: int = 10) -> requests.Session:
+    """Builds a requests Session that retries failed requests
+
+    Args:
+        pool_connections (int, optional): number of connection pools to cache. Defaults to 10.
+        pool_maxsize (int, optional): maximum number of connections to keep in each pool. Defaults to 10.
+
+    Returns:
+        requests.Session: session with the retry policy mounted
+    """
+    session = requests.Session()
+    retries = Retry(total=5, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _request_with_retry(method: Text, url: Text, session: Optional[requests.Session] = None, **params) -> requests.Response:
     """Wrapper around requests with Session to retry in case it fails
 
     Args:
         method (Text): HTTP method, such as 'GET' or 'HEAD'.
         url (Text): The URL of the resource to fetch.
+        session (Optional[requests.Session], optional): Session to send the request with, so that its
+            connections can be reused across calls. Defaults to None, which creates a new session.
         **params: Params to pass to request function
 
     Returns:
         requests.Response: Response object of the request
     """
-    session = requests.Session()
-    retries = Retry(total=5, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504])
-    session.mount("https://", HTTPAdapter(max_retries=retries))
+    if session is None:
+        session = _build_session()
     response = session.request(method=method.upper(), url=url, **params)
     return response
 
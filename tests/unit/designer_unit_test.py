@@ -19,7 +19,7 @@ from aixplain.modules.pipeline.designer.enums import (
     NodeType,
 )
 
-from aixplain.modules.pipeline.designer.mixins import LinkableMixin
+from aixplain.modules.pipeline.designer.mixins import LinkableMixin, OutputableMixin
 from aixplain.modules.pipeline.designer.pipeline import DesignerPipeline
 
 
@@ -661,7 +661,55 @@ def test_pipeline_add_link():
 
     link = Link(from_node=a, to_node=b, from_param="output", to_param="input")
     pipeline.add_link(link)
+    assert pipeline._from_nodes == {a}
+    assert pipeline._to_nodes == {b}
 
     with mock.patch.object(link, "attach_to") as mock_attach_to:
         pipeline.add_link(link)
         mock_attach_to.assert_called_once_with(pipeline)
+
+
+def test_pipeline_validate_nodes():
+    pipeline = DesignerPipeline()
+
+    class InputNode(Node, LinkableMixin):
+        type: NodeType = NodeType.INPUT
+
+    class AssetNode(Node, LinkableMixin, OutputableMixin):
+        type: NodeType = NodeType.ASSET
+
+    class OutputNode(Node):
+        type: NodeType = NodeType.OUTPUT
+
+    a = InputNode(pipeline=pipeline)
+    b = AssetNode(pipeline=pipeline)
+    c = OutputNode(pipeline=pipeline)
+    a.outputs.create_param("input", DataType.TEXT)
+    b.inputs.create_param("text", DataType.TEXT)
+    b.outputs.create_param("data", DataType.TEXT)
+    c.inputs.create_param("output", DataType.TEXT)
+
+    a.link(b, "input", "text")
+
+    with pytest.raises(ValueError) as excinfo:
+        pipeline.validate_nodes()
+
+    assert "ASSET(ID=1)" in str(excinfo.value)
+
+    b.link(c, "data", "output")
+    pipeline.validate_nodes()
+
+
+def test_node_subclass_registry():
+    from aixplain.modules.pipeline.designer.base import _NODE_CLASSES
+    from aixplain.modules.pipeline.designer.nodes import AssetNode, Input, Output
+
+    assert _NODE_CLASSES[NodeType.ASSET] is AssetNode
+    assert _NODE_CLASSES[NodeType.INPUT] is Input
+    assert _NODE_CLASSES[NodeType.OUTPUT] is Output
+    assert Input.type == NodeType.INPUT
+
+    class FooNode(Node):
+        type: NodeType = NodeType.SCRIPT
+
+    assert _NODE_CLASSES[NodeType.SCRIPT] is not FooNode
@@ -96,3 +96,16 @@ def test_get_pipeline_error_response():
             PipelineFactory.get(pipeline_id=pipeline_id)
 
         assert "Pipeline GET Error: Failed to retrieve pipeline test-pipeline-id. Status Code: 404" in str(excinfo.value)
+
+
+def test_get_first_k_assets_concatenates_pages_in_order():
+    with requests_mock.Mocker() as mock:
+        for page_number in range(3):
+            url = urljoin(config.BACKEND_URL, f"sdk/pipelines/?pageNumber={page_number}")
+            items = [{"id": f"pipeline-{page_number}-{i}", "name": f"Pipeline {page_number}-{i}"} for i in range(2)]
+            mock.get(url, json={"items": items}, status_code=200)
+
+        pipelines = PipelineFactory.get_first_k_assets(25)
+
+    expected_ids = [f"pipeline-{page_number}-{i}" for page_number in range(3) for i in range(2)]
+    assert [pipeline.id for pipeline in pipelines] == expected_ids